@@ -5,142 +5,420 @@ interactions. Ready for PyInstaller packaging into a single executable.
 
 from __future__ import annotations
 
+import argparse
+import functools
+import multiprocessing
+import queue
 import random
+import sys
+import threading
 import time
 import tkinter as tk
 from dataclasses import dataclass, field
 from tkinter import messagebox
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
-Board = List[List[int]]
+Board = bytearray  # 81 cells, row-major: index r * 9 + c
 Coord = Tuple[int, int]
+Cell = Tuple[int, int, int]  # row, column, box
+# op ("set", "note_toggle", "hint"), cell, old/new value, old/new notes mask
+Move = Tuple[str, Coord, int, int, int, int]
 
 
 # --------------------------- Sudoku engine --------------------------------- #
 
+# Lookup tables over flat cell indices, built once at import time.
+_ROW: Tuple[int, ...] = tuple(i // 9 for i in range(81))
+_COL: Tuple[int, ...] = tuple(i % 9 for i in range(81))
+_BOX: Tuple[int, ...] = tuple(3 * (i // 27) + (i % 9) // 3 for i in range(81))
+_CELLS: Tuple[Cell, ...] = tuple(zip(_ROW, _COL, _BOX))
+# Number of set bits in every 9-bit candidate mask.
+_POPCOUNT = bytes(bin(mask).count("1") for mask in range(512))
+# Every row, column and box as a tuple of cell indices.
+_UNITS: Tuple[Tuple[int, ...], ...] = (
+    tuple(tuple(i for i in range(81) if _ROW[i] == n) for n in range(9))
+    + tuple(tuple(i for i in range(81) if _COL[i] == n) for n in range(9))
+    + tuple(tuple(i for i in range(81) if _BOX[i] == n) for n in range(9))
+)
+# The 20 cells sharing a row, column or box with each cell.
+_PEERS: Tuple[FrozenSet[int], ...] = tuple(
+    frozenset(
+        j
+        for j in range(81)
+        if j != i
+        and (_ROW[j] == _ROW[i] or _COL[j] == _COL[i] or _BOX[j] == _BOX[i])
+    )
+    for i in range(81)
+)
+
+# Solved grids from independent random fills; _random_grid picks one and
+# derives each new solution from it by symmetries. None has a band or stack
+# repeating the same three triples in every box, as pattern grids do, since
+# the symmetries would carry that into every puzzle.
+_BASE_GRIDS: Tuple[bytes, ...] = tuple(
+    bytes(int(digit) for digit in grid)
+    for grid in """
+    763129485298654371541873629659412738482397156137586294814735962976248513325961847
+    617358492549267813823914657154783269398526741762491538271649385936875124485132976
+    568921473421637985379458162283169547195374826647582319754896231832715694916243758
+    912468537354271869867539412598624371243715698176893245789342156421956783635187924
+    368957214149362857572481639291538746485716392637249185823694571956173428714825963
+    314879256895362417726541938967128345432756189581493762153987624678214593249635871
+    825179463167453892349268751213947586456812937798635214581324679672591348934786125
+    715463289946872513823951647698715324172634895354298761261547938487329156539186472
+    624387519739251846185496327341529768892764153576813492263175984917648235458932671
+    791438265324659178568172493145826739839517642276394581913745826657283914482961357
+    736845129591672438824913657153487296247596813689321745362158974415769382978234561
+    236847519179235864854619732328194657465378291791526348682951473943762185517483926
+    """.split()
+)
+
 
 def deep_copy_board(board: Board) -> Board:
-    return [row[:] for row in board]
+    return bytearray(board)
+
+
+def _board_masks(board: Board) -> Tuple[List[int], List[int], List[int], List[Cell]]:
+    """Build row/column/box digit bitmasks and the list of empty cells."""
+    rmask = [0] * 9
+    cmask = [0] * 9
+    bmask = [0] * 9
+    empties: List[Cell] = []
+    for i, num in enumerate(board):
+        r, c, b = _CELLS[i]
+        if num:
+            bit = 1 << (num - 1)
+            rmask[r] |= bit
+            cmask[c] |= bit
+            bmask[b] |= bit
+        else:
+            empties.append(_CELLS[i])
+    return rmask, cmask, bmask, empties
+
+
+def _select_cell(
+    idx: int,
+    empties: List[Cell],
+    rmask: List[int],
+    cmask: List[int],
+    bmask: List[int],
+) -> Tuple[int, int]:
+    """Return the position and candidates of the most constrained empty cell.
+
+    Scans ``empties[idx:]`` for the cell with the fewest candidates
+    (minimum remaining values), stopping early on a forced or dead cell.
+    """
+    popcount = _POPCOUNT
+    best_pos = idx
+    best_avail = 0
+    best_count = 10
+    for pos in range(idx, len(empties)):
+        r, c, b = empties[pos]
+        avail = 0x1FF & ~(rmask[r] | cmask[c] | bmask[b])
+        count = popcount[avail]
+        if count < best_count:
+            best_pos, best_avail, best_count = pos, avail, count
+            if count <= 1:
+                break
+    return best_pos, best_avail
+
+
+def _is_forced(
+    i: int,
+    bit: int,
+    board: Board,
+    rmask: List[int],
+    cmask: List[int],
+    bmask: List[int],
+) -> bool:
+    """Whether the remaining givens force ``bit`` back into cell ``i``.
+
+    Holds when it is the cell's only candidate (naked single) or no other
+    empty cell of ``board`` in one of its units can take it (hidden single).
+    Removing such a cell cannot create a second solution.
+    """
+    r, c, b = _CELLS[i]
+    if 0x1FF & ~(rmask[r] | cmask[c] | bmask[b]) == bit:
+        return True
+    for unit in (_UNITS[r], _UNITS[9 + c], _UNITS[18 + b]):
+        for j in unit:
+            if j == i or board[j]:
+                continue
+            jr, jc, jb = _CELLS[j]
+            if not (rmask[jr] | cmask[jc] | bmask[jb]) & bit:
+                break
+        else:
+            return True
+    return False
+
+
+def _propagate(
+    idx: int,
+    empties: List[Cell],
+    rmask: List[int],
+    cmask: List[int],
+    bmask: List[int],
+) -> Tuple[bool, int, List[Tuple[int, int, int, int]]]:
+    """Fill naked and hidden singles in ``empties[idx:]`` until a fixed point.
+
+    Forced cells are moved in front of the remaining slice. Returns whether
+    the grid is still consistent, the new start index, and the
+    ``(row, col, box, bit)`` assignments for :func:`_unassign`.
+    """
+    assigned: List[Tuple[int, int, int, int]] = []
+    changed = True
+    while changed:
+        changed = False
+        for pos in range(idx, len(empties)):
+            r, c, b = empties[pos]
+            avail = 0x1FF & ~(rmask[r] | cmask[c] | bmask[b])
+            if not avail:
+                return False, idx, assigned
+            if not avail & (avail - 1):
+                rmask[r] ^= avail
+                cmask[c] ^= avail
+                bmask[b] ^= avail
+                assigned.append((r, c, b, avail))
+                empties[idx], empties[pos] = empties[pos], empties[idx]
+                idx += 1
+                changed = True
+        if not changed and idx < len(empties):
+            count = len(assigned)
+            ok, idx = _hidden_singles(idx, empties, rmask, cmask, bmask, assigned)
+            if not ok:
+                return False, idx, assigned
+            changed = len(assigned) > count
+    return True, idx, assigned
+
+
+def _hidden_singles(
+    idx: int,
+    empties: List[Cell],
+    rmask: List[int],
+    cmask: List[int],
+    bmask: List[int],
+    assigned: List[Tuple[int, int, int, int]],
+) -> Tuple[bool, int]:
+    """Assign digits that have only one possible cell left in a unit.
+
+    One pass over ``empties[idx:]`` records, per row, column and box, the
+    digits seen once and the digits seen more than once. A unit missing a
+    digit that no cell can take, or a cell that is the only home of two
+    digits, is a contradiction.
+    """
+    once = [0] * 27
+    twice = [0] * 27
+    for pos in range(idx, len(empties)):
+        r, c, b = empties[pos]
+        avail = 0x1FF & ~(rmask[r] | cmask[c] | bmask[b])
+        c += 9
+        b += 18
+        twice[r] |= once[r] & avail
+        once[r] |= avail
+        twice[c] |= once[c] & avail
+        once[c] |= avail
+        twice[b] |= once[b] & avail
+        once[b] |= avail
+    masks = rmask + cmask + bmask
+    for u in range(27):
+        if once[u] | masks[u] != 0x1FF:
+            return False, idx
+        once[u] &= ~twice[u]
+    for pos in range(idx, len(empties)):
+        r, c, b = empties[pos]
+        single = once[r] | once[9 + c] | once[18 + b]
+        if not single:
+            continue
+        single &= 0x1FF & ~(rmask[r] | cmask[c] | bmask[b])
+        if not single:
+            continue
+        if single & (single - 1):
+            return False, idx
+        rmask[r] ^= single
+        cmask[c] ^= single
+        bmask[b] ^= single
+        assigned.append((r, c, b, single))
+        empties[idx], empties[pos] = empties[pos], empties[idx]
+        idx += 1
+    return True, idx
+
+
+def _unassign(
+    assigned: List[Tuple[int, int, int, int]],
+    rmask: List[int],
+    cmask: List[int],
+    bmask: List[int],
+) -> None:
+    for r, c, b, bit in assigned:
+        rmask[r] ^= bit
+        cmask[c] ^= bit
+        bmask[b] ^= bit
+
+
+def _count_solutions_bits(
+    idx: int,
+    empties: List[Cell],
+    rmask: List[int],
+    cmask: List[int],
+    bmask: List[int],
+    limit: int,
+) -> int:
+    """Count completions up to ``limit``; the masks are restored on return."""
+    ok, idx, assigned = _propagate(idx, empties, rmask, cmask, bmask)
+    if not ok:
+        count = 0
+    elif idx == len(empties):
+        count = 1
+    else:
+        count = _branch_count(idx, empties, rmask, cmask, bmask, limit)
+    _unassign(assigned, rmask, cmask, bmask)
+    return count
+
+
+def _branch_count(
+    idx: int,
+    empties: List[Cell],
+    rmask: List[int],
+    cmask: List[int],
+    bmask: List[int],
+    limit: int,
+) -> int:
+    pos, avail = _select_cell(idx, empties, rmask, cmask, bmask)
+    if not avail:
+        return 0
+    empties[idx], empties[pos] = empties[pos], empties[idx]
+    r, c, b = empties[idx]
+    count = 0
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        rmask[r] ^= bit
+        cmask[c] ^= bit
+        bmask[b] ^= bit
+        count += _count_solutions_bits(idx + 1, empties, rmask, cmask, bmask, limit)
+        rmask[r] ^= bit
+        cmask[c] ^= bit
+        bmask[b] ^= bit
+        if count >= limit:
+            break
+    return count
 
 
 class SudokuGenerator:
     """Generate full Sudoku boards and dig holes while keeping uniqueness."""
 
-    def __init__(self) -> None:
-        self.size = 9
-        self.box = 3
-
-    def _find_empty(self, board: Board) -> Optional[Coord]:
-        for r in range(self.size):
-            for c in range(self.size):
-                if board[r][c] == 0:
-                    return r, c
-        return None
-
-    def _is_valid(self, board: Board, row: int, col: int, num: int) -> bool:
-        if num in board[row]:
-            return False
-        if any(board[r][col] == num for r in range(self.size)):
-            return False
-        start_r = (row // self.box) * self.box
-        start_c = (col // self.box) * self.box
-        for r in range(start_r, start_r + self.box):
-            for c in range(start_c, start_c + self.box):
-                if board[r][c] == num:
-                    return False
-        return True
-
-    def _solve(self, board: Board) -> bool:
-        empty = self._find_empty(board)
-        if not empty:
-            return True
-        r, c = empty
-        nums = list(range(1, 10))
-        random.shuffle(nums)
-        for num in nums:
-            if self._is_valid(board, r, c, num):
-                board[r][c] = num
-                if self._solve(board):
-                    return True
-                board[r][c] = 0
-        return False
+    def __init__(self, seed: Optional[int] = None) -> None:
+        # A private RNG, so concurrent generators never share global state.
+        self.rng = random.Random(seed)
+
+    def _random_grid(self) -> Board:
+        """Return a random solved grid without running the solver.
+
+        Picks one of ``_BASE_GRIDS``, relabels its digits and permutes its
+        bands, rows within each band, stacks and columns within each stack,
+        optionally transposing; every one of these maps a valid grid to a
+        valid grid.
+        """
+        base = self.rng.choice(_BASE_GRIDS)
+        digits = self.rng.sample(range(1, 10), 9)
+        rows = [
+            band * 3 + r
+            for band in self.rng.sample(range(3), 3)
+            for r in self.rng.sample(range(3), 3)
+        ]
+        cols = [
+            stack * 3 + c
+            for stack in self.rng.sample(range(3), 3)
+            for c in self.rng.sample(range(3), 3)
+        ]
+        grid = bytearray(digits[base[r * 9 + c] - 1] for r in rows for c in cols)
+        if self.rng.getrandbits(1):
+            grid = bytearray(grid[c * 9 + r] for r in range(9) for c in range(9))
+        return grid
 
     def _count_solutions(self, board: Board, limit: int = 2) -> int:
-        empty = self._find_empty(board)
-        if not empty:
-            return 1
-        r, c = empty
-        count = 0
-        for num in range(1, 10):
-            if self._is_valid(board, r, c, num):
-                board[r][c] = num
-                count += self._count_solutions(board, limit)
-                board[r][c] = 0
-                if count >= limit:
-                    break
-        return count
+        rmask, cmask, bmask, empties = _board_masks(board)
+        return _count_solutions_bits(0, empties, rmask, cmask, bmask, limit)
 
     def _dig_holes(self, board: Board, holes: int) -> None:
-        attempts = holes * 6
+        rmask, cmask, bmask, empties = _board_masks(board)
+        positions = [i for i in range(81) if board[i]]
+        self.rng.shuffle(positions)
         removed = 0
-        while removed < holes and attempts > 0:
-            r = random.randint(0, 8)
-            c = random.randint(0, 8)
-            if board[r][c] == 0:
-                attempts -= 1
-                continue
-            backup = board[r][c]
-            board[r][c] = 0
-            board_copy = deep_copy_board(board)
-            if self._count_solutions(board_copy) == 1:
+        for i in positions:
+            if removed >= holes:
+                break
+            cell = _CELLS[i]
+            r, c, b = cell
+            bit = 1 << (board[i] - 1)
+            rmask[r] ^= bit
+            cmask[c] ^= bit
+            bmask[b] ^= bit
+            # The search permutes empties; restore row-major order each time
+            # rather than branching in the random dig order.
+            empties.append(cell)
+            empties.sort()
+            if _is_forced(i, bit, board, rmask, cmask, bmask) or (
+                _count_solutions_bits(0, empties, rmask, cmask, bmask, 2) == 1
+            ):
+                board[i] = 0
                 removed += 1
             else:
-                board[r][c] = backup
-            attempts -= 1
+                empties.remove(cell)
+                rmask[r] ^= bit
+                cmask[c] ^= bit
+                bmask[b] ^= bit
 
     def generate(self, difficulty: str) -> Tuple[Board, Board]:
         config = DIFFICULTIES.get(difficulty, DIFFICULTIES["medium"])
-        board: Board = [[0] * 9 for _ in range(9)]
-        self._solve(board)
+        board = self._random_grid()
         solution = deep_copy_board(board)
         self._dig_holes(board, config["holes"])
         return board, solution
 
 
+def make_puzzle(difficulty: str, seed: int) -> Tuple[Board, Board]:
+    """Generate one ``(puzzle, solution)`` pair, reproducible from ``seed``."""
+    return SudokuGenerator(seed).generate(difficulty)
+
+
+def generate_many(
+    count: int,
+    difficulty: str,
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+) -> List[Tuple[Board, Board]]:
+    """Generate ``count`` puzzles in parallel worker processes.
+
+    Puzzle ``i`` uses seed ``seed + i`` (a random base when ``seed`` is
+    None) and is returned at index ``i``, so a given seed always yields the
+    same list.
+    """
+    base = random.randrange(2**32) if seed is None else seed
+    with multiprocessing.Pool(processes) as pool:
+        return list(
+            pool.imap(
+                functools.partial(make_puzzle, difficulty),
+                range(base, base + count),
+            )
+        )
+
+
 def find_conflicts(board: Board) -> Set[Coord]:
     """Return coordinates that violate Sudoku rules."""
     conflicts: Set[Coord] = set()
-    # Rows and columns
-    for idx in range(9):
-        seen_row: Dict[int, List[int]] = {}
-        seen_col: Dict[int, List[int]] = {}
-        for j in range(9):
-            row_val = board[idx][j]
-            col_val = board[j][idx]
-            if row_val:
-                seen_row.setdefault(row_val, []).append(j)
-            if col_val:
-                seen_col.setdefault(col_val, []).append(j)
-        for cols in seen_row.values():
-            if len(cols) > 1:
-                for col in cols:
-                    conflicts.add((idx, col))
-        for rows in seen_col.values():
-            if len(rows) > 1:
-                for row in rows:
-                    conflicts.add((row, idx))
-    # Boxes
-    for br in range(0, 9, 3):
-        for bc in range(0, 9, 3):
-            seen_box: Dict[int, List[Coord]] = {}
-            for r in range(br, br + 3):
-                for c in range(bc, bc + 3):
-                    val = board[r][c]
-                    if val:
-                        seen_box.setdefault(val, []).append((r, c))
-            for coords in seen_box.values():
-                if len(coords) > 1:
-                    conflicts.update(coords)
+    for unit in _UNITS:
+        seen = 0
+        dup = 0
+        for i in unit:
+            val = board[i]
+            if val:
+                bit = 1 << val
+                if seen & bit:
+                    dup |= bit
+                seen |= bit
+        if dup:
+            conflicts.update(divmod(i, 9) for i in unit if dup >> board[i] & 1)
     return conflicts
 
 
@@ -162,13 +440,19 @@ class SudokuGame:
     hints_left: int
     max_mistakes: int
     mistakes: int = 0
-    notes: Dict[Coord, Set[int]] = field(default_factory=dict)
-    history: List[Tuple[Board, Dict[Coord, Set[int]], int, int]] = field(
-        default_factory=list
-    )
-    future: List[Tuple[Board, Dict[Coord, Set[int]], int, int]] = field(
-        default_factory=list
-    )
+    # Pencil marks per cell as a 9-bit mask; bit n - 1 set means note n.
+    notes: Dict[Coord, int] = field(default_factory=dict)
+    history: List[Move] = field(default_factory=list)
+    future: List[Move] = field(default_factory=list)
+    _fixed: Set[Coord] = field(init=False, repr=False, default_factory=set)
+    _conflicts: Set[Coord] = field(init=False, repr=False, default_factory=set)
+    _dirty: bool = field(init=False, repr=False, default=True)
+
+    def __post_init__(self) -> None:
+        # Givens never change during a game, so compute them once.
+        self._fixed = {
+            divmod(i, 9) for i, val in enumerate(self.puzzle) if val != 0
+        }
 
     @classmethod
     def new(cls, difficulty: str) -> "SudokuGame":
@@ -183,92 +467,115 @@ class SudokuGame:
             max_mistakes=cfg["max_mistakes"],
         )
 
+    def cell(self, r: int, c: int) -> int:
+        return self.puzzle[r * 9 + c]
+
+    def set_cell(self, r: int, c: int, value: int) -> None:
+        self.puzzle[r * 9 + c] = value
+        self._dirty = True
+
     @property
     def fixed_cells(self) -> Set[Coord]:
-        return {(r, c) for r in range(9) for c in range(9) if self.puzzle[r][c] != 0}
-
-    def push_state(self) -> None:
-        self.history.append(
-            (
-                deep_copy_board(self.puzzle),
-                {k: set(v) for k, v in self.notes.items()},
-                self.mistakes,
-                self.hints_left,
-            )
-        )
+        return self._fixed
+
+    @property
+    def conflicts(self) -> Set[Coord]:
+        """Conflicting cells, recomputed only after the board changed."""
+        if self._dirty:
+            self._conflicts = find_conflicts(self.puzzle)
+            self._dirty = False
+        return self._conflicts
+
+    def _push(self, move: Move) -> None:
+        self.history.append(move)
         self.future.clear()
+        self._apply(move, forward=True)
+
+    def _apply(self, move: Move, forward: bool) -> None:
+        """Apply ``move`` (or revert it when ``forward`` is False)."""
+        op, coord, old_value, new_value, old_notes, new_notes = move
+        r, c = coord
+        value, notes = (new_value, new_notes) if forward else (old_value, old_notes)
+        self.set_cell(r, c, value)
+        if notes:
+            self.notes[coord] = notes
+        else:
+            self.notes.pop(coord, None)
+        step = 1 if forward else -1
+        if op == "set" and new_value and new_value != self.solution[r * 9 + c]:
+            self.mistakes += step
+        elif op == "hint":
+            self.hints_left -= step
 
     def undo(self) -> None:
         if not self.history:
             return
-        snapshot = self.history.pop()
-        self.future.append(
-            (
-                deep_copy_board(self.puzzle),
-                {k: set(v) for k, v in self.notes.items()},
-                self.mistakes,
-                self.hints_left,
-            )
-        )
-        self.puzzle, self.notes, self.mistakes, self.hints_left = snapshot
+        move = self.history.pop()
+        self._apply(move, forward=False)
+        self.future.append(move)
 
     def redo(self) -> None:
         if not self.future:
             return
-        snapshot = self.future.pop()
-        self.history.append(
-            (
-                deep_copy_board(self.puzzle),
-                {k: set(v) for k, v in self.notes.items()},
-                self.mistakes,
-                self.hints_left,
-            )
-        )
-        self.puzzle, self.notes, self.mistakes, self.hints_left = snapshot
+        move = self.future.pop()
+        self._apply(move, forward=True)
+        self.history.append(move)
+
+    def _cell_notes(self, coord: Coord) -> int:
+        return self.notes.get(coord, 0)
 
     def set_value(self, coord: Coord, value: int) -> None:
         if coord in self.fixed_cells:
             return
-        self.push_state()
         r, c = coord
-        self.puzzle[r][c] = value
-        self.notes.pop(coord, None)
-        if value and value != self.solution[r][c]:
-            self.mistakes += 1
+        old_value = self.cell(r, c)
+        self._push(
+            ("set", coord, old_value, value, self._cell_notes(coord), 0)
+        )
 
     def toggle_note(self, coord: Coord, value: int) -> None:
         if coord in self.fixed_cells:
             return
-        self.push_state()
-        note_set = self.notes.setdefault(coord, set())
-        if value in note_set:
-            note_set.remove(value)
-        else:
-            note_set.add(value)
-        if not note_set:
-            self.notes.pop(coord, None)
+        r, c = coord
+        notes = self._cell_notes(coord)
+        current = self.cell(r, c)
+        bit = 1 << (value - 1)
+        self._push(("note_toggle", coord, current, current, notes, notes ^ bit))
 
     def hint(self, coord: Coord) -> Optional[int]:
         if self.hints_left <= 0 or coord in self.fixed_cells:
             return None
-        self.push_state()
         r, c = coord
-        self.puzzle[r][c] = self.solution[r][c]
-        self.notes.pop(coord, None)
-        self.hints_left -= 1
-        return self.puzzle[r][c]
+        old_value = self.cell(r, c)
+        answer = self.solution[r * 9 + c]
+        self._push(
+            ("hint", coord, old_value, answer, self._cell_notes(coord), 0)
+        )
+        return answer
 
     def is_complete(self) -> bool:
-        return all(
-            self.puzzle[r][c] == self.solution[r][c]
-            for r in range(9)
-            for c in range(9)
-        )
+        return self.puzzle == self.solution
 
 
 # --------------------------- UI layer -------------------------------------- #
 
 
+@functools.lru_cache(maxsize=256)
+def _blend_quantized(c1: str, c2: str, ratio_q: int) -> str:
+    """Interpolate two ``#rrggbb`` colors at ``ratio_q / 256``."""
+
+    def to_rgb(c: str) -> Tuple[int, int, int]:
+        return int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16)
+
+    ratio = ratio_q / 256
+    r1, g1, b1 = to_rgb(c1)
+    r2, g2, b2 = to_rgb(c2)
+    r = int(r1 + (r2 - r1) * ratio)
+    g = int(g1 + (g2 - g1) * ratio)
+    b = int(b1 + (b2 - b1) * ratio)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
 class SudokuApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -283,8 +590,24 @@ class SudokuApp(tk.Tk):
         self.pencil_mode = False
         self.start_time = time.time()
         self.running = True
-
-        self.game = SudokuGame.new("medium")
+        self._timer_job: Optional[str] = None
+
+        # Puzzles are generated on worker threads and handed over via a queue
+        # as (difficulty, game); game is None when generation failed.
+        self._gen_queue: "queue.Queue[Tuple[str, Optional[SudokuGame]]]" = queue.Queue()
+        self._generating: Set[str] = set()
+        self._spare_games: Dict[str, SudokuGame] = {}
+        self._pending_difficulty: Optional[str] = None
+        self._polling = False
+
+        # Empty board shown until the first generated puzzle is installed.
+        self.game = SudokuGame(
+            puzzle=bytearray(81),
+            solution=bytearray(81),
+            difficulty="medium",
+            hints_left=0,
+            max_mistakes=DIFFICULTIES["medium"]["max_mistakes"],
+        )
         self.home_difficulty = "medium"
 
         self.accent_colors = ["#22d3ee", "#a855f7", "#38bdf8", "#f472b6"]
@@ -295,9 +618,10 @@ class SudokuApp(tk.Tk):
         self._build_game()
         self.show_home()
 
+        self._keymap = self._build_keymap()
         self.bind("<Key>", self.on_key)
-        self.after(250, self._tick_timer)
         self.after(1200, self._animate_accent)
+        self._start_generation(self.home_difficulty)
 
     # --------------------------- Layout ---------------------------------- #
 
@@ -309,29 +633,41 @@ class SudokuApp(tk.Tk):
         self.layer.place(relx=0, rely=0, relwidth=1, relheight=1)
 
     def _draw_background(self) -> None:
+        """Paint the gradient and glow discs into one image item."""
         self.bg_canvas.delete("all")
         width = 1000
         height = 900
         steps = 40
+        # Keep a reference on self; Tk drops images that get garbage-collected.
+        self._bg_img = tk.PhotoImage(width=width, height=height)
         for i in range(steps):
             ratio = i / steps
             color = self._blend("#0b1220", "#0d1b2e", ratio)
-            self.bg_canvas.create_rectangle(
-                0, height * ratio, width, height * (ratio + 1 / steps), fill=color, outline=""
-            )
+            y0 = int(height * ratio)
+            y1 = int(height * (ratio + 1 / steps))
+            self._bg_img.put(color, to=(0, y0, width, y1))
         for cx, cy, r, color in [
             (780, 160, 140, "#1b4e63"),
             (220, 260, 180, "#162447"),
             (520, 620, 200, "#122034"),
         ]:
-            self.bg_canvas.create_oval(
-                cx - r,
-                cy - r,
-                cx + r,
-                cy + r,
-                fill=color,
-                outline="",
-            )
+            # Fill the disc with one span per run of pixel rows that share a
+            # half-width, rather than one per row.
+            spans: List[List[int]] = []  # [half-width, y0, y1]
+            for dy in range(-r, r):
+                half = int((r * r - (dy + 0.5) ** 2) ** 0.5)
+                if spans and spans[-1][0] == half:
+                    spans[-1][2] = cy + dy + 1
+                else:
+                    spans.append([half, cy + dy, cy + dy + 1])
+            for half, y0, y1 in spans:
+                y0 = max(y0, 0)
+                y1 = min(y1, height)
+                if half and y0 < y1:
+                    x0 = max(cx - half, 0)
+                    x1 = min(cx + half, width)
+                    self._bg_img.put(color, to=(x0, y0, x1, y1))
+        self.bg_canvas.create_image(0, 0, anchor="nw", image=self._bg_img)
 
     def _build_home(self) -> None:
         self.home_frame = tk.Frame(self.layer, bg="#050915", padx=32, pady=32)
@@ -446,6 +782,7 @@ class SudokuApp(tk.Tk):
         )
         self.canvas.pack()
         self.canvas.bind("<Button-1>", self.on_click)
+        self._build_board_items()
 
         sidebar = tk.Frame(body, bg="#050915")
         sidebar.grid(row=0, column=1, sticky="n")
@@ -506,15 +843,7 @@ class SudokuApp(tk.Tk):
     # --------------------------- UI helpers ------------------------------ #
 
     def _blend(self, c1: str, c2: str, ratio: float) -> str:
-        def to_rgb(c: str) -> Tuple[int, int, int]:
-            return int(c[1:3], 16), int(c[3:5], 16), int(c[5:7], 16)
-
-        r1, g1, b1 = to_rgb(c1)
-        r2, g2, b2 = to_rgb(c2)
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return _blend_quantized(c1, c2, round(ratio * 256))
 
     def _make_button(
         self, text: str, command, primary: bool = False, width: int = 14, tall: bool = False
@@ -541,11 +870,18 @@ class SudokuApp(tk.Tk):
         return btn
 
     def _tick_timer(self) -> None:
-        if self.running:
-            elapsed = int(time.time() - self.start_time)
-            mins, secs = divmod(elapsed, 60)
-            self.timer_label.config(text=f"{mins:02d}:{secs:02d}")
-        self.after(500, self._tick_timer)
+        if not self.running:
+            # Stop ticking while paused; _resume_timer restarts the loop.
+            self._timer_job = None
+            return
+        elapsed = int(time.time() - self.start_time)
+        mins, secs = divmod(elapsed, 60)
+        self.timer_label.config(text=f"{mins:02d}:{secs:02d}")
+        self._timer_job = self.after(500, self._tick_timer)
+
+    def _resume_timer(self) -> None:
+        if self._timer_job is None:
+            self._tick_timer()
 
     def _status_text(self) -> str:
         return (
@@ -555,116 +891,246 @@ class SudokuApp(tk.Tk):
         )
 
     def _animate_accent(self) -> None:
+        if not self.game_frame.winfo_ismapped():
+            self.after(1200, self._animate_accent)
+            return
         color = self.accent_colors[self.accent_index]
         self.accent_index = (self.accent_index + 1) % len(self.accent_colors)
         self.title_label.config(fg=color)
+        self._paint_glow()
         self.bg_canvas.after(1200, self._animate_accent)
 
-    def _redraw(self) -> None:
-        self.canvas.delete("all")
-        conflicts = find_conflicts(self.game.puzzle)
-        glow_color = self._blend("#22d3ee", "#a855f7", (time.time() % 1))
+    def _build_board_items(self) -> None:
+        """Create every board canvas item once; _redraw only reconfigures them."""
+        self._cell_rects: List[List[int]] = []
+        self._cell_texts: List[List[int]] = []
+        self._note_texts: List[List[List[int]]] = []
         for r in range(9):
+            rect_row: List[int] = []
+            text_row: List[int] = []
+            note_row: List[List[int]] = []
             for c in range(9):
                 x0 = c * self.cell_px
                 y0 = r * self.cell_px
-                x1 = x0 + self.cell_px
-                y1 = y0 + self.cell_px
-
-                base = "#0c1424"
-                selected_fill = "#162136"
-                row_highlight = "#10192c"
-
-                fill = base
-                if self.selected:
-                    sr, sc = self.selected
-                    same_row = r == sr
-                    same_col = c == sc
-                    same_box = (r // 3, c // 3) == (sr // 3, sc // 3)
-                    if same_row or same_col or same_box:
-                        fill = row_highlight
-                    if (r, c) == self.selected:
-                        fill = selected_fill
-
-                if (r, c) in conflicts:
-                    fill = "#201427"
-
-                self.canvas.create_rectangle(
-                    x0, y0, x1, y1, fill=fill, outline="#0d1528", width=1
+                rect_row.append(
+                    self.canvas.create_rectangle(
+                        x0,
+                        y0,
+                        x0 + self.cell_px,
+                        y0 + self.cell_px,
+                        fill="#0c1424",
+                        outline="#0d1528",
+                        width=1,
+                    )
                 )
-
-                val = self.game.puzzle[r][c]
-                if val:
-                    fixed = (r, c) in self.game.fixed_cells
-                    color = "#e2e8f0" if not fixed else "#22d3ee"
+                text_row.append(
                     self.canvas.create_text(
                         x0 + self.cell_px / 2,
                         y0 + self.cell_px / 2,
-                        text=str(val),
-                        fill=color,
+                        text="",
+                        fill="#e2e8f0",
                         font=("Helvetica", 18, "bold"),
                     )
-                elif (r, c) in self.game.notes:
-                    notes = sorted(self.game.notes[(r, c)])
-                    for note in notes:
-                        nr = (note - 1) // 3
-                        nc = (note - 1) % 3
-                        nx = x0 + (nc + 0.5) * (self.cell_px / 3)
-                        ny = y0 + (nr + 0.5) * (self.cell_px / 3)
+                )
+                notes: List[int] = []
+                for note in range(1, 10):
+                    nr = (note - 1) // 3
+                    nc = (note - 1) % 3
+                    notes.append(
                         self.canvas.create_text(
-                            nx,
-                            ny,
+                            x0 + (nc + 0.5) * (self.cell_px / 3),
+                            y0 + (nr + 0.5) * (self.cell_px / 3),
                             text=str(note),
                             fill="#64748b",
                             font=("Helvetica", 9, "bold"),
+                            state="hidden",
                         )
+                    )
+                note_row.append(notes)
+            self._cell_rects.append(rect_row)
+            self._cell_texts.append(text_row)
+            self._note_texts.append(note_row)
 
+        self._glow_lines: List[int] = []
         for i in range(10):
             width = 3 if i % 3 == 0 else 1
-            color = glow_color if i % 3 == 0 else "#1f2937"
-            self.canvas.create_line(
-                i * self.cell_px,
-                0,
-                i * self.cell_px,
-                self.board_px,
-                fill=color,
-                width=width,
-            )
-            self.canvas.create_line(
-                0,
-                i * self.cell_px,
-                self.board_px,
-                i * self.cell_px,
-                fill=color,
-                width=width,
+            color = "#22d3ee" if i % 3 == 0 else "#1f2937"
+            lines = (
+                self.canvas.create_line(
+                    i * self.cell_px,
+                    0,
+                    i * self.cell_px,
+                    self.board_px,
+                    fill=color,
+                    width=width,
+                ),
+                self.canvas.create_line(
+                    0,
+                    i * self.cell_px,
+                    self.board_px,
+                    i * self.cell_px,
+                    fill=color,
+                    width=width,
+                ),
             )
+            if i % 3 == 0:
+                self._glow_lines.extend(lines)
+
+        # Last state pushed to the canvas, so unchanged items are skipped.
+        self._drawn_fill = [["#0c1424"] * 9 for _ in range(9)]
+        self._drawn_text = [[("", "#e2e8f0")] * 9 for _ in range(9)]
+        self._drawn_notes = [[0] * 9 for _ in range(9)]
+
+    def _paint_glow(self) -> None:
+        glow_color = self._blend("#22d3ee", "#a855f7", (time.time() % 1))
+        for item in self._glow_lines:
+            self.canvas.itemconfig(item, fill=glow_color)
 
+    def _redraw(self) -> None:
+        conflicts = self.game.conflicts
+        fixed_cells = self.game.fixed_cells
+        base = "#0c1424"
+        selected_fill = "#162136"
+        row_highlight = "#10192c"
+        peers: FrozenSet[int] = frozenset()
+        if self.selected:
+            sr, sc = self.selected
+            peers = _PEERS[sr * 9 + sc]
+        for r in range(9):
+            for c in range(9):
+                fill = base
+                if r * 9 + c in peers:
+                    fill = row_highlight
+                if (r, c) == self.selected:
+                    fill = selected_fill
+
+                if (r, c) in conflicts:
+                    fill = "#201427"
+
+                if fill != self._drawn_fill[r][c]:
+                    self.canvas.itemconfig(self._cell_rects[r][c], fill=fill)
+                    self._drawn_fill[r][c] = fill
+
+                val = self.game.cell(r, c)
+                if val:
+                    fixed = (r, c) in fixed_cells
+                    text = (str(val), "#e2e8f0" if not fixed else "#22d3ee")
+                    notes = 0
+                else:
+                    text = ("", "#e2e8f0")
+                    notes = self.game.notes.get((r, c), 0)
+
+                if text != self._drawn_text[r][c]:
+                    self.canvas.itemconfig(
+                        self._cell_texts[r][c], text=text[0], fill=text[1]
+                    )
+                    self._drawn_text[r][c] = text
+
+                changed = notes ^ self._drawn_notes[r][c]
+                if changed:
+                    self._drawn_notes[r][c] = notes
+                    while changed:
+                        bit = changed & -changed
+                        changed ^= bit
+                        self.canvas.itemconfig(
+                            self._note_texts[r][c][bit.bit_length() - 1],
+                            state="normal" if notes & bit else "hidden",
+                        )
+
+        self._paint_glow()
         self.status_label.config(text=self._status_text())
 
+    # --------------------------- Generation ------------------------------ #
+
+    def _gen_worker(self, difficulty: str) -> None:
+        game = None
+        try:
+            game = SudokuGame.new(difficulty)
+        finally:
+            # Always report back, so _poll_gen stops waiting on a failed worker.
+            self._gen_queue.put((difficulty, game))
+
+    def _start_generation(self, difficulty: str) -> None:
+        if difficulty in self._generating:
+            return
+        self._generating.add(difficulty)
+        threading.Thread(
+            target=self._gen_worker, args=(difficulty,), daemon=True
+        ).start()
+        if not self._polling:
+            self._polling = True
+            self.after(50, self._poll_gen)
+
+    def _poll_gen(self) -> None:
+        while True:
+            try:
+                difficulty, game = self._gen_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._generating.discard(difficulty)
+            if game is None:
+                if difficulty == self._pending_difficulty:
+                    self._pending_difficulty = None
+                    self._redraw()
+                    messagebox.showerror(
+                        "Sudoku", f"Could not generate a {difficulty} puzzle."
+                    )
+            elif difficulty == self._pending_difficulty:
+                self._pending_difficulty = None
+                self._install_game(game)
+            else:
+                self._spare_games[difficulty] = game
+        if self._generating:
+            self.after(50, self._poll_gen)
+        else:
+            self._polling = False
+
+    def _install_game(self, game: SudokuGame) -> None:
+        self.game = game
+        self.selected = None
+        self.start_time = time.time()
+        self.running = True
+        self._resume_timer()
+        self.pencil_mode = False
+        self._redraw()
+        # Have the next puzzle of this difficulty ready before it is asked for.
+        self._start_generation(game.difficulty)
+
     # --------------------------- Events ---------------------------------- #
 
     def on_click(self, event: tk.Event) -> None:
+        if self._pending_difficulty is not None:
+            return
         col = event.x // self.cell_px
         row = event.y // self.cell_px
         if 0 <= row < 9 and 0 <= col < 9:
             self.selected = (row, col)
             self._redraw()
 
+    def _build_keymap(self) -> Dict[Tuple[str, str], Callable[[], None]]:
+        """Map ``(modifier, keysym)`` to the shortcut it triggers."""
+        keymap: Dict[Tuple[str, str], Callable[[], None]] = {}
+        for mod in ("", "ctrl"):
+            for keysym in ("BackSpace", "Delete", "space"):
+                keymap[(mod, keysym)] = lambda: self.handle_number(0)
+            for keysym in ("p", "P"):
+                keymap[(mod, keysym)] = self.toggle_pencil
+            for keysym in ("h", "H"):
+                keymap[(mod, keysym)] = self.use_hint
+        for keysym in ("z", "Z"):
+            keymap[("ctrl", keysym)] = self.undo  # Ctrl+Z
+        for keysym in ("y", "Y"):
+            keymap[("ctrl", keysym)] = self.redo  # Ctrl+Y
+        return keymap
+
     def on_key(self, event: tk.Event) -> None:
         if self.game_frame.winfo_ismapped() is False:
             return
         if not self.selected:
             return
-        if event.keysym in {"BackSpace", "Delete", "space"}:
-            self.handle_number(0)
-        elif event.keysym.lower() == "p":
-            self.toggle_pencil()
-        elif event.keysym.lower() == "h":
-            self.use_hint()
-        elif event.state & 0x4 and event.keysym.lower() == "z":  # Ctrl+Z
-            self.undo()
-        elif event.state & 0x4 and event.keysym.lower() == "y":  # Ctrl+Y
-            self.redo()
+        action = self._keymap.get(("ctrl" if event.state & 0x4 else "", event.keysym))
+        if action is not None:
+            action()
         elif event.char.isdigit():
             val = int(event.char)
             if val == 0:
@@ -682,9 +1148,8 @@ class SudokuApp(tk.Tk):
             self.game.toggle_note(coord, value)
         else:
             self.game.set_value(coord, value)
-            if value and self.game.puzzle[coord[0]][coord[1]] == self.game.solution[
-                coord[0]
-            ][coord[1]]:
+            r, c = coord
+            if value and self.game.cell(r, c) == self.game.solution[r * 9 + c]:
                 self.game.notes.pop(coord, None)
         self._redraw()
         self._check_completion()
@@ -695,16 +1160,16 @@ class SudokuApp(tk.Tk):
         self.game_frame.pack_forget()
         self.home_frame.pack(fill="both", expand=True)
         self.running = False
+        # A puzzle still generating is kept as a spare instead of installed.
+        self._pending_difficulty = None
         self.home_status.config(
             text=f"Difficulty: {self.home_difficulty.title()} • Hints and pencil ready."
         )
 
     def start_from_home(self) -> None:
-        self.new_game(self.home_difficulty)
         self.home_frame.pack_forget()
         self.game_frame.pack(fill="both", expand=True)
-        self.running = True
-        self.start_time = time.time()
+        self.new_game(self.home_difficulty)
 
     def _select_home_difficulty(self, difficulty: str) -> None:
         self.home_difficulty = difficulty
@@ -716,24 +1181,27 @@ class SudokuApp(tk.Tk):
                 btn.config(bg="#22d3ee", fg="#0b1120")
             else:
                 btn.config(bg="#111827", fg="#e2e8f0")
+        self._start_generation(difficulty)
 
     def new_game(self, difficulty: str) -> None:
-        self.game = SudokuGame.new(difficulty)
+        game = self._spare_games.pop(difficulty, None)
+        if game is not None:
+            self._install_game(game)
+            return
+        self._pending_difficulty = difficulty
         self.selected = None
-        self.start_time = time.time()
-        self.running = True
-        self.pencil_mode = False
+        self.running = False
+        self._start_generation(difficulty)
+        # Clear the old selection and peer highlight while the puzzle loads.
         self._redraw()
+        self.status_label.config(text=f"Generating {difficulty.title()} puzzle…")
 
     def reset_progress(self) -> None:
-        self.game = SudokuGame.new(self.game.difficulty)
-        self.selected = None
-        self.start_time = time.time()
-        self.running = True
-        self.pencil_mode = False
-        self._redraw()
+        self.new_game(self._pending_difficulty or self.game.difficulty)
 
     def toggle_pencil(self) -> None:
+        if self._pending_difficulty is not None:
+            return
         self.pencil_mode = not self.pencil_mode
         state = "ON" if self.pencil_mode else "OFF"
         self.status_label.config(text=f"{self._status_text()} • Pencil {state}")
@@ -749,15 +1217,21 @@ class SudokuApp(tk.Tk):
         self._check_completion()
 
     def undo(self) -> None:
+        if self._pending_difficulty is not None:
+            return
         self.game.undo()
         self._redraw()
 
     def redo(self) -> None:
+        if self._pending_difficulty is not None:
+            return
         self.game.redo()
         self._redraw()
 
     def check_progress(self) -> None:
-        conflicts = find_conflicts(self.game.puzzle)
+        if self._pending_difficulty is not None:
+            return
+        conflicts = self.game.conflicts
         if not conflicts:
             messagebox.showinfo("Sudoku", "No conflicts so far. Keep going!")
         else:
@@ -785,9 +1259,41 @@ class SudokuApp(tk.Tk):
             )
 
 
-def main() -> None:
-    app = SudokuApp()
-    app.mainloop()
+def main(argv: Optional[List[str]] = None) -> None:
+    # Lets Pool workers start inside a frozen (PyInstaller) build.
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description="Neon Sudoku desktop app.")
+    parser.add_argument(
+        "--batch",
+        type=int,
+        metavar="N",
+        help="generate N puzzles in parallel and write them out instead of "
+        "opening the app",
+    )
+    parser.add_argument("--difficulty", choices=list(DIFFICULTIES), default="medium")
+    parser.add_argument("--seed", type=int, help="base seed for reproducible batches")
+    parser.add_argument(
+        "--output", metavar="FILE", help="batch output file (default: stdout)"
+    )
+    args = parser.parse_args(argv)
+    if args.batch is not None and args.batch < 1:
+        parser.error("--batch must be at least 1")
+    if args.batch is None:
+        app = SudokuApp()
+        app.mainloop()
+        return
+    # One line per puzzle: the puzzle with "." for blanks, then its solution.
+    lines = [
+        "".join(str(v) if v else "." for v in puzzle)
+        + " "
+        + "".join(map(str, solution))
+        for puzzle, solution in generate_many(args.batch, args.difficulty, args.seed)
+    ]
+    if args.output:
+        with open(args.output, "w", encoding="ascii") as out:
+            out.write("\n".join(lines) + "\n")
+    else:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":